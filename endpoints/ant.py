@@ -1,9 +1,12 @@
-def ant_endpoint(client, captcha_token, page_action, user_agent, ip_address):
+import orjson
+
+
+async def ant_endpoint(client, captcha_token, page_action, user_agent, ip_address):
     """
     Send a POST request to an endpoint with a captcha token and additional information.
 
     Args:
-        client: The HTTP client used to make the POST request.
+        client: The async HTTP client used to make the POST request.
         captcha_token (str): The captcha token to be sent in the request.
         page_action (str): The action related to the page.
         user_agent (str): The user agent string.
@@ -12,13 +15,13 @@ def ant_endpoint(client, captcha_token, page_action, user_agent, ip_address):
     Returns:
         dict: A dictionary containing the response JSON merged with additional information.
     """
-    response = client.post(
+    response = await client.post(
         "https://antcpt.com/score_detector/verify.php",
         headers={"Content-Type": "application/json"},
         json={"g-recaptcha-response": captcha_token},
     )
-    response_json = response.json()
-    response_json.update(
-        {"action": page_action, "user_agent": user_agent, "ip_address": ip_address}
-    )
+    response_json = orjson.loads(response.content)
+    response_json["action"] = page_action
+    response_json["user_agent"] = user_agent
+    response_json["ip_address"] = ip_address
     return response_json
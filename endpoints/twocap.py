@@ -1,11 +1,14 @@
-def twocap_endpoint(
+import orjson
+
+
+async def twocap_endpoint(
     client, sitekey, captcha_token, page_action, user_agent, ip_address
 ):
     """
     Send a POST request to the 2captcha endpoint with the provided data and return the updated JSON response.
 
     Args:
-        client: The HTTP client used to make the POST request.
+        client: The async HTTP client used to make the POST request.
         sitekey: The site key for the captcha.
         captcha_token: The token generated for the captcha.
         page_action: The action associated with the page.
@@ -16,7 +19,7 @@ def twocap_endpoint(
         dict: The updated JSON response including additional data like action, user_agent, and ip_address.
     """
 
-    response = client.post(
+    response = await client.post(
         "https://2captcha.com/api/v1/captcha-demo/recaptcha-enterprise/verify",
         headers={"Content-Type": "application/json"},
         json={
@@ -24,8 +27,8 @@ def twocap_endpoint(
             "token": captcha_token,
         },
     )
-    response_json = response.json()
-    response_json.update(
-        {"action": page_action, "user_agent": user_agent, "ip_address": ip_address}
-    )
+    response_json = orjson.loads(response.content)
+    response_json["action"] = page_action
+    response_json["user_agent"] = user_agent
+    response_json["ip_address"] = ip_address
     return response_json
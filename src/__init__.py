@@ -1,3 +1,3 @@
 from .captcha_solver import CaptchaSolver
 from .rich_console import RichConsole
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
@@ -1,15 +1,79 @@
 import base64
+import os
 import re
-from dataclasses import dataclass
-from urllib.parse import urlparse
-
-from rich.box import HEAVY
-from rich.table import Table
-from rich.traceback import install as traceback_install
+import threading
+from dataclasses import dataclass, fields
+from urllib.parse import urlencode, urlparse
 
 from .rich_console import RichConsole
 
-traceback_install(show_locals=True, word_wrap=True)
+if os.environ.get("CAPTCHA_DEBUG"):
+    from rich.traceback import install as traceback_install
+
+    traceback_install(show_locals=True, word_wrap=True)
+
+_SITEKEY_RE = re.compile(r"render=(.*?)'|execute\('(.*?)'|&#x27;(.*?)&")
+_ACTION_RE = re.compile(r"action: '(.*?)'")
+_API_RE = re.compile(r"/recaptcha/(api|enterprise)\.")
+_ANCHOR_TOKEN_RE = re.compile(r'recaptcha-token" value="(.*?)"')
+_RRESP_RE = re.compile(r'"rresp","(.*?)"')
+
+_ANCHOR_TOKEN_MARKER = b'recaptcha-token" value="'
+_RRESP_MARKER = b'"rresp","'
+
+_SITEKEY_PREFIXES = (("render=", "'"), ("execute('", "'"), ("&#x27;", "&"))
+
+
+def _find_sitekey(text):
+    """
+    Finds the sitekey by probing for its known literal prefixes.
+
+    Each prefix is located with a single str.find pass and the value is
+    sliced up to its delimiter; the earliest non-empty hit wins, matching
+    the leftmost-match behavior of the old alternation regex without its
+    backtracking.
+
+    Args:
+        text (str): The HTML to scan for a sitekey.
+
+    Returns:
+        str or None: The sitekey if any prefix matched, otherwise None.
+    """
+    best = None
+    for prefix, suffix in _SITEKEY_PREFIXES:
+        start = text.find(prefix)
+        if start < 0:
+            continue
+        start += len(prefix)
+        end = text.find(suffix, start)
+        if end < 0:
+            continue
+        value = text[start:end]
+        if value and (best is None or start < best[0]):
+            best = (start, value)
+    return best[1] if best else None
+
+
+def _scan_marker(buffer, marker):
+    """
+    Scans a byte buffer for a marker and slices out the quoted value after it.
+
+    Args:
+        buffer (bytes): The accumulated response bytes to scan.
+        marker (bytes): The literal marker preceding the value.
+
+    Returns:
+        str or None: The decoded value if the marker and closing quote are
+            both present, otherwise None.
+    """
+    start = buffer.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    end = buffer.find(b'"', start)
+    if end < 0:
+        return None
+    return buffer[start:end].decode()
 
 
 @dataclass
@@ -47,14 +111,14 @@ class CaptchaSolver:
         verbose (bool, optional): Whether to print Captcha data information. Defaults to false.
 
     Methods:
-        - extract_data: Extracts data from a URL response based on a given pattern.
+        - extract_data: Extracts data from pre-fetched response text based on a given pattern.
         - get_sitekey: Gets the sitekey from the response text.
         - get_page_action: Extracts the action value from the page content.
         - construct_url: Constructs a URL with a specified port based on the base URL.
         - encode_co: Encodes the constructed URL.
         - get_api_type: Get the API type.
         - construct_anchor: Construct the anchor URL for a Google reCAPTCHA.
-        - get_anchor_token: Get the anchor token from the provided anchor URL.
+        - get_anchor_token: Get the anchor token by streaming the anchor page.
         - build_payload: Build a payload string for a CAPTCHA request.
         - get_captcha_token: Get the CAPTCHA token for a given CAPTCHA challenge.
         - solve_captcha: Solves a captcha challenge and returns the captcha token.
@@ -74,52 +138,54 @@ class CaptchaSolver:
             verbose (bool, optional): Whether to print Captcha data information. Defaults to false.
         """
         self._base_url = base_url
+        parsed_url = urlparse(base_url)
+        self._origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
         self._verbose = verbose
         self.sitekey = None
         self.page_action = None
+        self._base_html_cache = None
+        self._anchor_prefix = None
+        self._anchor_suffix = None
+        self._reload_url = None
 
-    def _extract_data(self, client, url, pattern):
+    def _extract_data(self, text, pattern):
         """
-        Extracts data from a URL response based on a given pattern.
+        Extracts data from pre-fetched response text based on a given pattern.
 
         Args:
-            client: The HTTP client used to make the request.
-            url (str): The URL to fetch the data from.
-            pattern (str): The regex pattern to search for in the response.
+            text (str): The response text to search in.
+            pattern (re.Pattern): The precompiled pattern to search for in the text.
 
         Returns:
             str or None: The extracted data if found, otherwise None.
         """
-        response = client.get(url)
-        if match := re.search(pattern, response.text):
+        if match := pattern.search(text):
             return match[1] or match[2] or match[3] or None
         return None
 
-    def _get_sitekey(self, client):
+    def _get_sitekey(self, html):
         """
         Gets the sitekey from the response text.
 
         Args:
-            client: The HTTP client used to make the request.
+            html (str): The HTML of the base URL page.
 
         Returns:
             str or None: The sitekey extracted from the response text, or None if not found.
         """
-        pattern = r"render=(.*?)'|execute\('(.*?)'|&#x27;(.*?)&"
-        return self._extract_data(client, self._base_url, pattern)
+        return _find_sitekey(html) or self._extract_data(html, _SITEKEY_RE)
 
-    def _get_page_action(self, client):
+    def _get_page_action(self, html):
         """
         Extracts the action value from the page content.
 
         Args:
-            client: The HTTP client used to make the request.
+            html (str): The HTML of the base URL page.
 
         Returns:
             str: The action value extracted from the page content.
         """
-        pattern = r"action: '(.*?)'"
-        return self._extract_data(client, self._base_url, pattern)
+        return self._extract_data(html, _ACTION_RE)
 
     def _construct_url(self, port="443"):
         """
@@ -131,8 +197,7 @@ class CaptchaSolver:
         Returns:
             str: The constructed URL with the specified port.
         """
-        parsed_url = urlparse(self._base_url)
-        return f"{parsed_url.scheme}://{parsed_url.netloc}:{port}"
+        return f"{self._origin}:{port}"
 
     def _encode_co(self, constructed_url):
         """
@@ -145,22 +210,20 @@ class CaptchaSolver:
             str: The encoded URL.
         """
         encoded_url = base64.b64encode(constructed_url.encode()).decode()
-        return encoded_url.rstrip("=") + "." * (
-            len(encoded_url) - len(encoded_url.rstrip("="))
-        )
+        stripped = encoded_url.rstrip("=")
+        return stripped + "." * (len(encoded_url) - len(stripped))
 
-    def _get_api_type(self, client):
+    def _get_api_type(self, html):
         """
         Get the API type.
 
         Args:
-            client: The HTTP client used to make the request.
+            html (str): The HTML of the base URL page.
 
         Returns:
             str or None: The API type extracted from the response text, or None if not found.
         """
-        pattern = r"/recaptcha/(api|enterprise)\."
-        api_type = self._extract_data(client, self._base_url, pattern)
+        api_type = self._extract_data(html, _API_RE)
         return "api2" if api_type == "api" else "enterprise"
 
     def _construct_anchor(self, sitekey, co_value, api_type):
@@ -175,21 +238,35 @@ class CaptchaSolver:
         Returns:
             str: The constructed anchor URL for the reCAPTCHA.
         """
-        return f"{self.CAPTCHA_URL}/{api_type}/anchor?ar=1&k={sitekey}&co={co_value}&hl=en&size=invisible"
+        if self._reload_url is None:
+            self._anchor_prefix = f"{self.CAPTCHA_URL}/{api_type}/anchor?ar=1&k="
+            self._anchor_suffix = f"&co={co_value}&hl=en&size=invisible"
+            self._reload_url = f"{self.CAPTCHA_URL}/{api_type}/reload"
+        return self._anchor_prefix + sitekey + self._anchor_suffix
 
-    def _get_anchor_token(self, client, anchor_url):
+    async def _get_anchor_token(self, client, anchor_url):
         """
-        Get the anchor token from the provided anchor URL.
+        Get the anchor token by streaming the anchor page.
+
+        The body is scanned chunk by chunk for the token marker so the fetch
+        short-circuits as soon as the token is seen instead of decoding the
+        whole page.
 
         Args:
-            client: The HTTP client used to make the request.
+            client: The async HTTP client used to make the request.
             anchor_url (str): The URL to fetch the anchor token from.
 
         Returns:
-            str or None: The anchor token extracted from the response text, or None if not found.
+            str or None: The anchor token extracted from the response body, or None if not found.
         """
-        pattern = r'recaptcha-token" value="(.*?)"'
-        return self._extract_data(client, anchor_url, pattern)
+        async with client.stream("GET", anchor_url) as response:
+            response.raise_for_status()
+            buffer = b""
+            async for chunk in response.aiter_bytes(chunk_size=4096):
+                buffer += chunk
+                if (token := _scan_marker(buffer, _ANCHOR_TOKEN_MARKER)) is not None:
+                    return token
+        return self._extract_data(buffer.decode(errors="replace"), _ANCHOR_TOKEN_RE)
 
     def _build_payload(self, anchor_token, co_value, sitekey):
         """
@@ -201,39 +278,74 @@ class CaptchaSolver:
             sitekey (str): The sitekey for the CAPTCHA request.
 
         Returns:
-            str: A formatted payload string for the CAPTCHA request.
+            str: A URL-encoded payload string for the CAPTCHA request.
         """
-        return f"reason=q&c={anchor_token}&k={sitekey}&co={co_value}"
+        return urlencode(
+            {"reason": "q", "c": anchor_token, "k": sitekey, "co": co_value}
+        )
 
-    def _get_captcha_token(self, client, anchor_token, co_value, sitekey, api_type):
+    async def _get_captcha_token(self, client, anchor_token, co_value, sitekey):
         """
         Get the CAPTCHA token for a given CAPTCHA challenge.
 
         Args:
-            client: The HTTP client used to make the request.
+            client: The async HTTP client used to make the request.
             anchor_token (str): The anchor token for the CAPTCHA request.
             co_value (str): The co value for the CAPTCHA request.
             sitekey (str): The sitekey for the CAPTCHA request.
-            api_type (str): The type of reCAPTCHA API to use.
 
         Returns:
             str: The CAPTCHA token extracted from the response, or None if not found.
         """
-        response = client.post(
-            f"{self.CAPTCHA_URL}/{api_type}/reload",
+        async with client.stream(
+            "POST",
+            self._reload_url,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             params={"k": sitekey},
             data=self._build_payload(anchor_token, co_value, sitekey),
-        )
-        match = re.search(r'"rresp","(.*?)"', response.text)
+        ) as response:
+            response.raise_for_status()
+            buffer = b""
+            async for chunk in response.aiter_bytes(chunk_size=4096):
+                buffer += chunk
+                if (token := _scan_marker(buffer, _RRESP_MARKER)) is not None:
+                    return token
+        match = _RRESP_RE.search(buffer.decode(errors="replace"))
         return match[1] if match else None
 
-    def solve_captcha(self, client):
+    def _render_captcha_table(self, captcha_data):
         """
-        Solves a captcha challenge using the provided client.
+        Renders the captcha data table to the console.
 
         Args:
-            client: The HTTP client used to make the request.
+            captcha_data (CaptchaData): The captcha data to display.
+
+        Returns:
+            None
+        """
+        from rich.box import HEAVY
+        from rich.table import Table
+
+        table = Table(show_header=False, box=HEAVY, border_style="purple")
+        table.add_column("Field", style="medium_purple")
+        table.add_column("Value", style="dodger_blue2")
+        for field in fields(captcha_data):
+            value = getattr(captcha_data, field.name)
+            if value is not None:
+                table.add_row(field.name, value)
+
+        RichConsole.print(table)
+
+    async def solve_captcha(self, client):
+        """
+        Solves a captcha challenge using the provided async client.
+
+        The base URL is fetched once and cached on the solver, and the sitekey,
+        page action, and API type are all extracted from that single response.
+        Repeated solves on the same solver reuse the cached HTML.
+
+        Args:
+            client: The async HTTP client used to make the requests.
 
         Returns:
             str: The captcha token generated after solving the captcha challenge.
@@ -241,11 +353,14 @@ class CaptchaSolver:
         Raises:
             ValueError: If the sitekey is not found.
         """
-        self.sitekey = self._get_sitekey(client)
+        if self._base_html_cache is None:
+            self._base_html_cache = (await client.get(self._base_url)).text
+        base_html = self._base_html_cache
+        self.sitekey = self._get_sitekey(base_html)
         if not self.sitekey:
             raise ValueError("Sitekey not found!")
-        self.page_action = self._get_page_action(client)
-        api_type = self._get_api_type(client)
+        self.page_action = self._get_page_action(base_html)
+        api_type = self._get_api_type(base_html)
         if not api_type:
             raise ValueError(
                 f"API Type not found! Please check the response text from {self._base_url}"
@@ -253,9 +368,9 @@ class CaptchaSolver:
         constructed_url = self._construct_url()
         co_value = self._encode_co(constructed_url)
         anchor_url = self._construct_anchor(self.sitekey, co_value, api_type)
-        anchor_token = self._get_anchor_token(client, anchor_url)
-        captcha_token = self._get_captcha_token(
-            client, anchor_token, co_value, self.sitekey, api_type
+        anchor_token = await self._get_anchor_token(client, anchor_url)
+        captcha_token = await self._get_captcha_token(
+            client, anchor_token, co_value, self.sitekey
         )
 
         if self._verbose:
@@ -269,12 +384,8 @@ class CaptchaSolver:
                 anchor_token=anchor_token,
                 captcha_token=captcha_token,
             )
-            table = Table(show_header=False, box=HEAVY, border_style="purple")
-            table.add_column("Field", style="medium_purple")
-            table.add_column("Value", style="dodger_blue2")
-            for field, value in captcha_data.__dict__.items():
-                table.add_row(field, value)
-
-            RichConsole.print(table)
+            threading.Thread(
+                target=self._render_captcha_table, args=(captcha_data,), daemon=True
+            ).start()
 
         return captcha_token
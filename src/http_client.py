@@ -1,10 +1,33 @@
-from random import uniform
+from random import choice, uniform
 
 import httpx
 from user_agent import generate_user_agent as user_agent
 
 from .rich_console import RichConsole
 
+_UA_POOL = tuple(str(user_agent()) for _ in range(64))
+
+
+def _pick_ua():
+    """
+    Picks a pre-generated User-Agent string from the module-level pool.
+
+    Returns:
+        str: A randomly chosen User-Agent string.
+    """
+    return choice(_UA_POOL)
+
+
+def _raise_for_status(response):
+    response.raise_for_status()
+
+
+async def _araise_for_status(response):
+    response.raise_for_status()
+
+
+_CAPTCHA_ORIGIN = "https://www.google.com/recaptcha"
+
 
 class LogHandler:
     """
@@ -30,7 +53,9 @@ class LogHandler:
 
     @staticmethod
     def log_response(response):
-        RichConsole.print(f"<Response> {response.status_code}", end="\n\n")
+        RichConsole.print(
+            f"<Response> {response.http_version} {response.status_code}", end="\n\n"
+        )
 
 
 class HttpClient(LogHandler):
@@ -41,7 +66,6 @@ class HttpClient(LogHandler):
         __init__: Initialize the client with an optional proxy URL.
         __enter__: Enter method for context management.
         __exit__: Exit method for context management.
-        _make_request: Make an HTTP request with error handling.
         get: Make a GET request to the specified URL.
         post: Make a POST request to the specified URL.
 
@@ -49,31 +73,41 @@ class HttpClient(LogHandler):
         None
     """
 
-    def __init__(self, proxy_url=None, log_handler=False, timeout=uniform(10, 15)):
+    def __init__(self, proxy_url=None, log_handler=False, timeout=None):
         """
         Initialize the client with an optional proxy URL.
 
         Args:
             proxy_url (str, optional): The proxy URL to use. Defaults to None.
             log_handler (bool, optional): Whether to print a log message. Defaults to False.
-            timeout (float): A random timeout between 10 and 15 seconds will be used.
+            timeout (float, optional): The request timeout in seconds. A random
+                timeout between 10 and 15 seconds is used when omitted.
 
         Returns:
             None
         """
-        self.base_agent = {"User-Agent": str(user_agent())}
+        hooks = {"request": [], "response": []}
+        if log_handler:
+            hooks["request"].append(self.log_request)
+            hooks["response"].append(self.log_response)
+        hooks["response"].append(_raise_for_status)
+        self.base_agent = {"User-Agent": _pick_ua()}
         self._client = httpx.Client(
             headers=self.base_agent,
-            proxy=proxy_url,
-            timeout=timeout,
-            event_hooks=(
-                {
-                    "request": [self.log_request],
-                    "response": [self.log_response],
-                }
-                if log_handler
-                else None
+            trust_env=bool(proxy_url),
+            timeout=uniform(10, 15) if timeout is None else timeout,
+            transport=httpx.HTTPTransport(
+                retries=1,
+                http2=True,
+                proxy=proxy_url,
+                trust_env=bool(proxy_url),
+                limits=httpx.Limits(
+                    max_connections=10,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=30,
+                ),
             ),
+            event_hooks=hooks,
         )
 
     def __enter__(self):
@@ -82,16 +116,142 @@ class HttpClient(LogHandler):
     def __exit__(self, *_):
         self._client.close()
 
-    def _make_request(self, method, url, **kwargs):
-        try:
-            response = self._client.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response
-        except (httpx.HTTPError, Exception) as exc:
-            raise exc
-
     def get(self, url, **kwargs):
-        return self._make_request("GET", url, **kwargs)
+        return self._client.get(url, **kwargs)
 
     def post(self, url, **kwargs):
-        return self._make_request("POST", url, **kwargs)
+        return self._client.post(url, **kwargs)
+
+
+class AsyncHttpClient(LogHandler):
+    """
+    AsyncHttpClient class for making HTTP requests over HTTP/2.
+
+    Methods:
+        __init__: Initialize the client with an optional proxy URL.
+        __aenter__: Enter method for async context management.
+        __aexit__: Exit method for async context management.
+        get: Make a GET request to the specified URL.
+        post: Make a POST request to the specified URL.
+        stream: Open a streaming request to the specified URL.
+        prewarm: Establish connections to the given URLs ahead of use.
+
+    Returns:
+        None
+    """
+
+    def __init__(self, proxy_url=None, log_handler=False, timeout=None, fast_tls=False):
+        """
+        Initialize the client with an optional proxy URL.
+
+        Args:
+            proxy_url (str, optional): The proxy URL to use. Defaults to None.
+            log_handler (bool, optional): Whether to print a log message. Defaults to False.
+            timeout (float, optional): The request timeout in seconds. A random
+                timeout between 10 and 15 seconds is used when omitted.
+            fast_tls (bool, optional): Whether to skip certificate verification
+                on the reCAPTCHA origin only, saving chain validation under
+                concurrent batch solves. Every other origin stays verified.
+                Defaults to False.
+
+        Returns:
+            None
+        """
+        hooks = {"request": [], "response": []}
+        if log_handler:
+            hooks["request"].append(self._alog_request)
+            hooks["response"].append(self._alog_response)
+        hooks["response"].append(_araise_for_status)
+        self.base_agent = {"User-Agent": _pick_ua()}
+        timeout = uniform(10, 15) if timeout is None else timeout
+        self._client = self._build_client(proxy_url, timeout, hooks)
+        self._captcha_client = (
+            self._build_client(proxy_url, timeout, hooks, verify=False)
+            if fast_tls
+            else self._client
+        )
+
+    def _build_client(self, proxy_url, timeout, hooks, verify=True):
+        """
+        Builds one underlying httpx.AsyncClient with the shared tuning.
+
+        Args:
+            proxy_url (str or None): The proxy URL to use.
+            timeout (float): The request timeout in seconds.
+            hooks (dict): The event hooks to register on the client.
+            verify (bool, optional): Whether to verify TLS certificates. Defaults to True.
+
+        Returns:
+            httpx.AsyncClient: The configured client.
+        """
+        return httpx.AsyncClient(
+            headers=self.base_agent,
+            trust_env=bool(proxy_url),
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                verify=verify,
+                proxy=proxy_url,
+                trust_env=bool(proxy_url),
+                limits=httpx.Limits(max_keepalive_connections=20),
+            ),
+            event_hooks=hooks,
+        )
+
+    def _client_for(self, url):
+        """
+        Picks the pool for a URL, routing reCAPTCHA traffic to the fast one.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            httpx.AsyncClient: The client to use for this URL.
+        """
+        if url.startswith(_CAPTCHA_ORIGIN):
+            return self._captcha_client
+        return self._client
+
+    async def _alog_request(self, request):
+        self.log_request(request)
+
+    async def _alog_response(self, response):
+        self.log_response(response)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self._client.aclose()
+        if self._captcha_client is not self._client:
+            await self._captcha_client.aclose()
+
+    async def get(self, url, **kwargs):
+        return await self._client_for(url).get(url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self._client_for(url).post(url, **kwargs)
+
+    def stream(self, method, url, **kwargs):
+        return self._client_for(url).stream(method, url, **kwargs)
+
+    async def prewarm(self, *urls):
+        """
+        Establish connections to the given URLs ahead of use.
+
+        Sends a HEAD request to each URL purely to finish DNS, TCP, and TLS
+        setup so the first real request on that origin skips the handshakes.
+        Response status and transport errors are ignored.
+
+        Args:
+            *urls (str): The URLs whose origins should be warmed up.
+
+        Returns:
+            None
+        """
+        for url in urls:
+            try:
+                await self._client_for(url).head(url)
+            except httpx.HTTPError:
+                pass